@@ -2,10 +2,10 @@
 Health check API endpoints.
 """
 
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter
 from app.config import get_settings
-from app.models.responses import HealthResponse, ErrorResponse
+from app.models.responses import HealthResponse, DetailedHealthResponse
+from app.services.health_service import get_health_snapshot
 
 settings = get_settings()
 router = APIRouter()
@@ -15,10 +15,10 @@ router = APIRouter()
     "/health",
     response_model=HealthResponse,
     summary="Health Check del Servicio",
-    description="Endpoint de health check para verificar el estado del servicio de atribución. Retorna información básica sobre el estado, nombre y versión del servicio. Usado para monitoreo automático y verificación de deployment.",
+    description="Endpoint de liveness para verificar el estado del servicio de atribución. Retorna el estado global del último snapshot del monitor de salud, nombre y versión del servicio. No consulta dependencias: usado para probes de Docker, Kubernetes y balanceadores.",
     responses={
         200: {
-            "description": "Servicio funcionando correctamente",
+            "description": "Servicio funcionando (ok o degraded según el último snapshot)",
             "content": {
                 "application/json": {
                     "example": {
@@ -28,23 +28,66 @@ router = APIRouter()
                     }
                 }
             }
-        },
-        500: {
-            "description": "Error interno del servidor",
+        }
+    }
+)
+async def health_check():
+    """Health check endpoint"""
+    return HealthResponse(
+        status=get_health_snapshot()["status"],
+        service=settings.app_name,
+        version=settings.app_version
+    )
+
+
+@router.get(
+    "/health/detailed",
+    response_model=DetailedHealthResponse,
+    summary="Health Check Detallado",
+    description="Retorna el último snapshot del monitor de salud con el estado, latencia y fecha del último chequeo de MongoDB, sec-session-identity-msa y la frescura del template. Los chequeos corren en background; este endpoint nunca consulta dependencias.",
+    responses={
+        200: {
+            "description": "Último snapshot de salud",
             "content": {
                 "application/json": {
                     "example": {
-                        "detail": "Error interno del servidor: Conexión a base de datos fallida"
+                        "status": "degraded",
+                        "service": "market-ads-attribution-msa",
+                        "version": "1.0.0",
+                        "checked_at": "2025-01-01T00:00:30+00:00",
+                        "checks": {
+                            "mongodb": {
+                                "status": "ok",
+                                "latency_ms": 3.2,
+                                "last_checked": "2025-01-01T00:00:30+00:00",
+                                "error": None
+                            },
+                            "session_service": {
+                                "status": "down",
+                                "latency_ms": 2000.4,
+                                "last_checked": "2025-01-01T00:00:30+00:00",
+                                "error": "Timeout"
+                            },
+                            "template": {
+                                "status": "ok",
+                                "latency_ms": 0.1,
+                                "last_checked": "2025-01-01T00:00:30+00:00",
+                                "error": None
+                            }
+                        }
                     }
                 }
             }
         }
     }
 )
-async def health_check():
-    """Health check endpoint"""
-    return HealthResponse(
-        status="ok", 
+async def health_check_detailed():
+    """Detailed health check endpoint"""
+    snapshot = get_health_snapshot()
+    return DetailedHealthResponse(
+        status=snapshot["status"],
         service=settings.app_name,
-        version=settings.app_version
-    )
\ No newline at end of file
+        version=settings.app_version,
+        checked_at=snapshot["checked_at"],
+        checks=snapshot["checks"]
+    )
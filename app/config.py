@@ -49,6 +49,16 @@ class Settings:
         self.mongodb_database = os.getenv("MONGODB_DATABASE", "templates_db")
         self.mongodb_collection = os.getenv("MONGODB_COLLECTION", "session_templates")
 
+        # Health Monitor Configuration (intervalo mínimo de 5s para no saturar dependencias)
+        self.health_check_interval = max(5.0, float(os.getenv("HEALTH_CHECK_INTERVAL", "30")))
+        self.health_check_timeout = float(os.getenv("HEALTH_CHECK_TIMEOUT", "2"))
+        self.template_max_age = float(os.getenv("TEMPLATE_MAX_AGE", "900"))
+
+        if not 0 < self.health_check_timeout < self.health_check_interval:
+            raise ValueError(
+                "HEALTH_CHECK_TIMEOUT must be greater than 0 and less than HEALTH_CHECK_INTERVAL"
+            )
+
 
 @lru_cache()
 def get_settings() -> Settings:
@@ -11,6 +11,7 @@ from fastapi.responses import JSONResponse
 
 from app.config import get_settings
 from app.api import health_router, redirect_router
+from app.services.health_service import start_health_monitor, stop_health_monitor
 
 # Configurar logging
 logger = logging.getLogger("uvicorn.error")
@@ -24,11 +25,13 @@ async def lifespan(app: FastAPI):
     Handles startup and shutdown events.
     """
     # Startup
+    start_health_monitor()
     logger.info(f"{settings.app_name} v{settings.app_version} ready on port {settings.api_port}")
     
     yield
     
     # Shutdown
+    await stop_health_monitor()
     logger.info(f"Shutting down {settings.app_name}")
 
 
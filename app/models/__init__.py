@@ -1,3 +1,15 @@
-from .responses import HealthResponse, ErrorResponse, ValidationErrorResponse
+from .responses import (
+    HealthResponse,
+    DependencyHealth,
+    DetailedHealthResponse,
+    ErrorResponse,
+    ValidationErrorResponse,
+)
 
-__all__ = ["HealthResponse", "ErrorResponse", "ValidationErrorResponse"]
\ No newline at end of file
+__all__ = [
+    "HealthResponse",
+    "DependencyHealth",
+    "DetailedHealthResponse",
+    "ErrorResponse",
+    "ValidationErrorResponse",
+]
\ No newline at end of file
@@ -3,7 +3,7 @@ Response models for API documentation.
 """
 
 from pydantic import BaseModel
-from typing import Optional
+from typing import Dict, Optional
 
 
 class HealthResponse(BaseModel):
@@ -13,6 +13,23 @@ class HealthResponse(BaseModel):
     version: str
 
 
+class DependencyHealth(BaseModel):
+    """Health status of a single dependency"""
+    status: str
+    latency_ms: Optional[float] = None
+    last_checked: Optional[str] = None
+    error: Optional[str] = None
+
+
+class DetailedHealthResponse(BaseModel):
+    """Detailed health check response model"""
+    status: str
+    service: str
+    version: str
+    checked_at: Optional[str] = None
+    checks: Dict[str, DependencyHealth]
+
+
 class ErrorResponse(BaseModel):
     """Error response model"""
     detail: str
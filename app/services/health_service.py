@@ -0,0 +1,148 @@
+"""
+Background health monitor for service dependencies.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Optional
+
+from app.config import get_settings
+from app.services.mongodb_service import (
+    ping_mongodb,
+    get_session_template,
+    get_template_cache_info,
+)
+from app.services.session_service import check_session_service
+
+logger = logging.getLogger("uvicorn.error")
+settings = get_settings()
+
+# Último snapshot calculado por el monitor; los endpoints solo lo leen
+_snapshot = {
+    "status": "starting",
+    "checked_at": None,
+    "checks": {}
+}
+_monitor_task: Optional[asyncio.Task] = None
+
+
+def get_health_snapshot() -> dict:
+    """Retorna el último snapshot de salud sin consultar dependencias"""
+    return _snapshot
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+async def _check_mongodb() -> Optional[str]:
+    """Ping a MongoDB vía Motor"""
+    await ping_mongodb()
+    return None
+
+
+async def _check_session_service() -> Optional[str]:
+    """Health de sec-session-identity-msa"""
+    await check_session_service(settings.health_check_timeout)
+    return None
+
+
+async def _check_template() -> Optional[str]:
+    """Frescura del template de sesión (refresca el cache si expiró)"""
+    # El refresh tiene su propio timeout, menor al del check, para que la
+    # antigüedad del cache se evalúe aunque MongoDB no responda
+    try:
+        await asyncio.wait_for(
+            get_session_template(), timeout=settings.health_check_timeout / 2
+        )
+    except Exception:
+        pass
+
+    info = get_template_cache_info()
+
+    if info["template_id"] is None:
+        return "No template cached"
+    if info["template_id"] == "fallback":
+        return "Using fallback template"
+    if info["age_seconds"] > settings.template_max_age:
+        return f"Template stale ({int(info['age_seconds'])}s)"
+    return None
+
+
+_CHECKS = {
+    "mongodb": _check_mongodb,
+    "session_service": _check_session_service,
+    "template": _check_template,
+}
+
+
+async def _run_check(name: str, check: Callable[[], Awaitable[Optional[str]]]) -> dict:
+    """Ejecuta un check con timeout y mide su latencia"""
+    start = time.monotonic()
+    try:
+        warning = await asyncio.wait_for(check(), timeout=settings.health_check_timeout)
+        status, error = ("degraded", warning) if warning else ("ok", None)
+    except asyncio.TimeoutError:
+        status, error = "down", "Timeout"
+    except Exception as e:
+        status, error = "down", type(e).__name__
+
+    if error:
+        logger.warning(f"Health check {name}: {status} ({error})")
+
+    return {
+        "status": status,
+        "latency_ms": round((time.monotonic() - start) * 1000, 2),
+        "last_checked": _now_iso(),
+        "error": error
+    }
+
+
+async def refresh_health_snapshot() -> dict:
+    """Ejecuta todos los checks en paralelo y reemplaza el snapshot"""
+    global _snapshot
+
+    results = await asyncio.gather(
+        *(_run_check(name, check) for name, check in _CHECKS.items())
+    )
+    checks = dict(zip(_CHECKS.keys(), results))
+
+    # El servicio sigue redirigiendo con fallbacks, por eso nunca queda "down"
+    overall = "ok" if all(c["status"] == "ok" for c in checks.values()) else "degraded"
+
+    _snapshot = {
+        "status": overall,
+        "checked_at": _now_iso(),
+        "checks": checks
+    }
+    return _snapshot
+
+
+async def _monitor_loop() -> None:
+    while True:
+        try:
+            await refresh_health_snapshot()
+        except Exception as e:
+            logger.error(f"Health monitor error: {type(e).__name__}")
+        await asyncio.sleep(settings.health_check_interval)
+
+
+def start_health_monitor() -> None:
+    """Inicia el monitor de salud en background"""
+    global _monitor_task
+    if _monitor_task is None or _monitor_task.done():
+        _monitor_task = asyncio.create_task(_monitor_loop())
+
+
+async def stop_health_monitor() -> None:
+    """Detiene el monitor de salud"""
+    global _monitor_task
+    if _monitor_task is not None:
+        _monitor_task.cancel()
+        try:
+            await _monitor_task
+        except asyncio.CancelledError:
+            pass
+        _monitor_task = None
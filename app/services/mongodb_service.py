@@ -15,6 +15,7 @@ mongo_db = mongo_client[settings.mongodb_database]
 mongo_collection = mongo_db[settings.mongodb_collection]
 
 # Cache del template (se actualiza cada 5 minutos)
+TEMPLATE_CACHE_TTL = 300
 _template_cache = None
 _cache_timestamp = 0
 
@@ -27,7 +28,7 @@ async def get_session_template() -> dict:
     current_time = time.time()
     
     # Usar cache si es válido (5 minutos)
-    if _template_cache and (current_time - _cache_timestamp) < 300:
+    if _template_cache and (current_time - _cache_timestamp) < TEMPLATE_CACHE_TTL:
         return _template_cache
     
     try:
@@ -57,6 +58,24 @@ async def get_session_template() -> dict:
         return _get_fallback_template()
 
 
+async def ping_mongodb() -> None:
+    """Verifica conectividad con MongoDB (lanza excepción si falla)"""
+    await mongo_client.admin.command("ping")
+
+
+def get_template_cache_info() -> dict:
+    """Retorna el id y la antigüedad (segundos) del template en cache"""
+    import time
+
+    if not _template_cache:
+        return {"template_id": None, "age_seconds": None}
+
+    return {
+        "template_id": _template_cache.get("_id"),
+        "age_seconds": time.time() - _cache_timestamp
+    }
+
+
 def _get_fallback_template() -> dict:
     """Template fallback hardcodeado"""
     return {
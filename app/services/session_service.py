@@ -46,4 +46,15 @@ async def register_click_event(payload: dict) -> str:
     except Exception as e:
         # Fallback rápido con log mínimo de error
         logger.warning(f"Session service fallback: {type(e).__name__}")
-        return str(uuid.uuid4())
\ No newline at end of file
+        return str(uuid.uuid4())
+
+
+async def check_session_service(timeout: float) -> int:
+    """Consulta el health de sec-session-identity-msa y retorna el status HTTP"""
+    client = get_http_client()
+    response = await client.get(
+        f"{settings.caching_service_url}/health",
+        timeout=timeout
+    )
+    response.raise_for_status()
+    return response.status_code
@@ -0,0 +1,129 @@
+"""
+Tests for the background health monitor.
+"""
+
+import asyncio
+
+import pytest
+
+from app.services import health_service
+
+
+@pytest.fixture(autouse=True)
+def healthy_dependencies(monkeypatch):
+    """Stubs all dependencies as healthy; each test overrides what it needs"""
+    async def ok(*args, **kwargs):
+        return None
+
+    monkeypatch.setattr(health_service, "ping_mongodb", ok)
+    monkeypatch.setattr(health_service, "check_session_service", ok)
+    monkeypatch.setattr(health_service, "get_session_template", ok)
+    monkeypatch.setattr(
+        health_service,
+        "get_template_cache_info",
+        lambda: {"template_id": "session.meta.ads.v1", "age_seconds": 10.0},
+    )
+    monkeypatch.setattr(health_service.settings, "health_check_timeout", 0.2)
+    monkeypatch.setattr(health_service.settings, "health_check_interval", 5.0)
+    monkeypatch.setattr(health_service.settings, "template_max_age", 900.0)
+
+
+def _refresh() -> dict:
+    return asyncio.run(health_service.refresh_health_snapshot())
+
+
+def test_all_dependencies_ok():
+    snapshot = _refresh()
+
+    assert snapshot["status"] == "ok"
+    assert set(snapshot["checks"]) == {"mongodb", "session_service", "template"}
+    for check in snapshot["checks"].values():
+        assert check["status"] == "ok"
+        assert check["error"] is None
+        assert check["latency_ms"] >= 0
+        assert check["last_checked"] is not None
+    assert health_service.get_health_snapshot() is snapshot
+
+
+def test_session_service_error_is_down(monkeypatch):
+    async def unauthorized(*args, **kwargs):
+        raise RuntimeError("401 Unauthorized")
+
+    monkeypatch.setattr(health_service, "check_session_service", unauthorized)
+    snapshot = _refresh()
+
+    assert snapshot["status"] == "degraded"
+    assert snapshot["checks"]["session_service"]["status"] == "down"
+    assert snapshot["checks"]["session_service"]["error"] == "RuntimeError"
+
+
+def test_timeout_is_down(monkeypatch):
+    async def hang(*args, **kwargs):
+        await asyncio.sleep(10)
+
+    monkeypatch.setattr(health_service, "ping_mongodb", hang)
+    snapshot = _refresh()
+
+    assert snapshot["status"] == "degraded"
+    assert snapshot["checks"]["mongodb"]["status"] == "down"
+    assert snapshot["checks"]["mongodb"]["error"] == "Timeout"
+
+
+def test_fallback_template_is_degraded(monkeypatch):
+    monkeypatch.setattr(
+        health_service,
+        "get_template_cache_info",
+        lambda: {"template_id": "fallback", "age_seconds": 1.0},
+    )
+    snapshot = _refresh()
+
+    assert snapshot["status"] == "degraded"
+    assert snapshot["checks"]["template"]["status"] == "degraded"
+
+
+def test_missing_template_is_degraded(monkeypatch):
+    monkeypatch.setattr(
+        health_service,
+        "get_template_cache_info",
+        lambda: {"template_id": None, "age_seconds": None},
+    )
+    snapshot = _refresh()
+
+    assert snapshot["checks"]["template"]["status"] == "degraded"
+    assert snapshot["checks"]["template"]["error"] == "No template cached"
+
+
+def test_stale_template_reported_when_refresh_hangs(monkeypatch):
+    async def hang(*args, **kwargs):
+        await asyncio.sleep(10)
+
+    monkeypatch.setattr(health_service, "get_session_template", hang)
+    monkeypatch.setattr(
+        health_service,
+        "get_template_cache_info",
+        lambda: {"template_id": "session.meta.ads.v1", "age_seconds": 1200.0},
+    )
+    snapshot = _refresh()
+
+    assert snapshot["checks"]["template"]["status"] == "degraded"
+    assert snapshot["checks"]["template"]["error"] == "Template stale (1200s)"
+
+
+def test_monitor_start_and_stop():
+    async def run():
+        health_service.start_health_monitor()
+        task = health_service._monitor_task
+        assert task is not None and not task.done()
+
+        # Iniciar dos veces no crea un segundo task
+        health_service.start_health_monitor()
+        assert health_service._monitor_task is task
+
+        await asyncio.sleep(0.05)
+        assert health_service.get_health_snapshot()["status"] == "ok"
+
+        await health_service.stop_health_monitor()
+        assert health_service._monitor_task is None
+        assert task.cancelled()
+
+    asyncio.run(run())